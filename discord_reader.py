@@ -1,8 +1,90 @@
 import html
+import random
 import re
 import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 import requests
-from typing import Any, Dict, List, Optional
+from requests.adapters import HTTPAdapter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from signal_parser import parse_signal
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional, stdlib json also accepts bytes
+    import json
+    _json_loads = json.loads
+
+# Discord snowflake epoch (2015-01-01) in ms; the timestamp is id >> 22
+DISCORD_EPOCH_MS = 1420070400000
+
+# Discord formatting stripped from message text: mentions, markdown, HTML-like tags
+_RE_DISCORD_FORMAT = re.compile(r"[<@!>&]|\*\*|\*|__|_|`|<.*?>")
+
+# The entities Discord actually emits; "&amp;" last so "&amp;lt;" stays "&lt;"
+_HTML_ESCAPES = (("&lt;", "<"), ("&gt;", ">"), ("&quot;", '"'), ("&#39;", "'"), ("&amp;", "&"))
+
+# Below this many messages a process pool costs more than it saves
+PARALLEL_EXTRACT_MIN = 1000
+
+
+def _iter_parts(msg: Dict[str, Any]) -> Iterator[str]:
+    """Yield the non-empty text fragments of a message."""
+    # Regular message content
+    content = msg.get("content")
+    if content:
+        yield content
+
+    # Process embeds (AO Trading uses these)
+    for embed in msg.get("embeds") or ():
+        # Embed title and description (main signal content)
+        title = embed.get("title")
+        if title:
+            yield title
+        description = embed.get("description")
+        if description:
+            yield description
+
+        # Embed fields (TP levels, DCA, etc.)
+        for field in embed.get("fields") or ():
+            field_name = field.get("name")
+            if field_name:
+                yield field_name
+            field_value = field.get("value")
+            if field_value:
+                yield field_value
+
+        # Footer text
+        footer_text = (embed.get("footer") or {}).get("text")
+        if footer_text:
+            yield footer_text
+
+
+def _unescape(text: str) -> str:
+    """html.unescape with a str.replace fast path for the entities above."""
+    amps = text.count("&")
+    if not amps:
+        return text
+    if amps != sum(text.count(entity) for entity, _ in _HTML_ESCAPES):
+        # Some other named/numeric entity: let html resolve everything
+        return html.unescape(text)
+    for entity, char in _HTML_ESCAPES:
+        text = text.replace(entity, char)
+    return text
+
+
+def _extract_text(msg: Dict[str, Any]) -> str:
+    """Module-level (picklable) body of DiscordReader.extract_text."""
+    text = " | ".join(_iter_parts(msg))
+
+    # Clean up Discord formatting (same as working old script)
+    text = _unescape(text)
+    # Remove mentions, markdown formatting, and HTML-like tags
+    text = _RE_DISCORD_FORMAT.sub("", text)
+
+    return text.strip()
 
 
 class DiscordReader:
@@ -12,34 +94,41 @@ class DiscordReader:
         self.token = token
         self.channel_id = channel_id
         self.base_url = "https://discord.com/api/v10"
+        self._messages_url = f"{self.base_url}/channels/{channel_id}/messages"
         # Use token as-is (don't add "Bot " prefix - user may have user token or already include prefix)
         self.headers = {
             "Authorization": token,
             "User-Agent": "AO-Trading-Bot/1.0",
         }
+        # Keep-alive session: polls reuse one TLS connection to discord.com
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
 
     def fetch_after(self, after_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
         """Fetch messages from channel after given message ID."""
-        url = f"{self.base_url}/channels/{self.channel_id}/messages?limit={limit}"
-        if after_id:
-            url += f"&after={after_id}"
+        params = {"limit": limit, "after": after_id} if after_id else {"limit": limit}
 
         for attempt in range(3):
             try:
-                r = requests.get(url, headers=self.headers, timeout=15)
+                r = self.session.get(self._messages_url, params=params, timeout=15)
 
-                # Handle rate limiting
+                # Handle rate limiting (headers carry the delay, no need to decode the body)
                 if r.status_code == 429:
-                    retry_after = float(r.json().get("retry_after", 5)) + 1
-                    time.sleep(retry_after)
+                    retry_after = float(
+                        r.headers.get("Retry-After") or r.headers.get("X-RateLimit-Reset-After") or 1.0
+                    )
+                    time.sleep(retry_after + 0.1)
                     continue
 
                 r.raise_for_status()
-                return r.json()
+                return _json_loads(r.content)
 
-            except requests.RequestException:
+            # ValueError: malformed body or header, retried like r.json() errors were
+            except (requests.RequestException, ValueError):
                 if attempt < 2:
-                    time.sleep(3)
+                    # Exponential backoff with jitter: 0.5s, 1s (+ up to 0.2s)
+                    time.sleep(0.5 * (2 ** attempt) + random.uniform(0, 0.2))
                 continue
 
         return []
@@ -51,59 +140,42 @@ class DiscordReader:
         - Regular message content
         - Embed titles, descriptions, and field values
         """
-        parts = []
-
-        # Regular message content
-        content = msg.get("content", "")
-        if content:
-            parts.append(content)
-
-        # Process embeds (AO Trading uses these)
-        for embed in msg.get("embeds", []):
-            # Embed title
-            title = embed.get("title", "")
-            if title:
-                parts.append(title)
-
-            # Embed description (main signal content)
-            description = embed.get("description", "")
-            if description:
-                parts.append(description)
-
-            # Embed fields (TP levels, DCA, etc.)
-            for field in embed.get("fields", []):
-                field_name = field.get("name", "")
-                field_value = field.get("value", "")
-                if field_name:
-                    parts.append(field_name)
-                if field_value:
-                    parts.append(field_value)
-
-            # Footer text
-            footer = embed.get("footer", {})
-            footer_text = footer.get("text", "")
-            if footer_text:
-                parts.append(footer_text)
-
-        # Join all parts
-        text = " | ".join(filter(None, parts))
-
-        # Clean up Discord formatting (same as working old script)
-        text = html.unescape(text)
-        # Remove mentions, markdown formatting, and HTML-like tags
-        text = re.sub(r"[<@!>&]|\*\*|\*|__|_|`|<.*?>", "", text)
-
-        return text.strip()
+        return _extract_text(msg)
+
+    def extract_texts(self, msgs: List[Dict[str, Any]]) -> List[str]:
+        """extract_text for a batch of messages, in order.
+
+        Large batches (historical backfills) are spread over a process
+        pool; regular poll batches are handled inline.
+        """
+        if len(msgs) < PARALLEL_EXTRACT_MIN:
+            return [_extract_text(m) for m in msgs]
+        with ProcessPoolExecutor() as ex:
+            return list(ex.map(_extract_text, msgs, chunksize=64))
+
+    def try_parse_message(self, msg: Dict[str, Any], quote: str) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """Parse a signal straight from a raw message.
+
+        Returns (text, signal). Messages with no fragment mentioning
+        "signal" or "entry" return ("", None) without building the
+        joined, cleaned text at all - that is most channel traffic.
+        """
+        for part in _iter_parts(msg):
+            folded = part.casefold()
+            if "signal" in folded or "entry" in folded:
+                break
+        else:
+            return "", None
+
+        text = _extract_text(msg)
+        return text, parse_signal(text, quote=quote)
 
     def message_timestamp_unix(self, msg: Dict[str, Any]) -> Optional[float]:
         """Extract Unix timestamp from Discord message ID (snowflake)."""
         try:
             msg_id = int(msg.get("id", 0))
             if msg_id:
-                # Discord epoch: 2015-01-01
-                discord_epoch = 1420070400000
-                timestamp_ms = (msg_id >> 22) + discord_epoch
-                return timestamp_ms / 1000.0
+                return ((msg_id >> 22) + DISCORD_EPOCH_MS) / 1000.0
         except (ValueError, TypeError):
             pass
 
@@ -111,7 +183,6 @@ class DiscordReader:
         ts_str = msg.get("timestamp")
         if ts_str:
             try:
-                from datetime import datetime
                 dt = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
                 return dt.timestamp()
             except Exception:
@@ -119,6 +190,19 @@ class DiscordReader:
 
         return None
 
+    def message_timestamps_unix(self, msgs: List[Dict[str, Any]]) -> List[Optional[float]]:
+        """Bulk message_timestamp_unix for a fetched batch of messages."""
+        try:
+            ids = [int(m["id"]) for m in msgs]
+        except (KeyError, ValueError, TypeError):
+            # Some message has no usable snowflake, resolve one by one
+            return [self.message_timestamp_unix(m) for m in msgs]
+        # A zero id falls back to the timestamp field, like message_timestamp_unix
+        return [
+            ((msg_id >> 22) + DISCORD_EPOCH_MS) / 1000.0 if msg_id else self.message_timestamp_unix(m)
+            for msg_id, m in zip(ids, msgs)
+        ]
+
     def get_latest_message_id(self) -> Optional[str]:
         """Get the ID of the latest message in the channel."""
         msgs = self.fetch_after(limit=1)
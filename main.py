@@ -14,7 +14,7 @@ from config import (
 )
 from bybit_v5 import BybitV5
 from discord_reader import DiscordReader
-from signal_parser import parse_signal, signal_hash
+from signal_parser import signal_hash
 from state import load_state, save_state, utc_day_key
 from trade_engine import TradeEngine
 
@@ -148,26 +148,26 @@ def main():
                 msgs_sorted = sorted(msgs, key=lambda m: int(m.get("id","0")))
                 max_seen = int(after or 0)
 
-                for m in msgs_sorted:
+                msg_ts = discord.message_timestamps_unix(msgs_sorted)
+
+                for m, ts in zip(msgs_sorted, msg_ts):
                     mid = int(m.get("id","0"))
                     max_seen = max(max_seen, mid)
 
                     # ignore very old messages
-                    ts = discord.message_timestamp_unix(m)
                     age = time.time() - ts if ts else 0
                     if ts and age > TC_MAX_LAG_SEC:
                         log.debug(f"Skipping old message (age={age:.0f}s > {TC_MAX_LAG_SEC}s)")
                         continue
 
-                    txt = discord.extract_text(m)
+                    txt, sig = discord.try_parse_message(m, QUOTE)
                     if not txt:
-                        log.debug(f"Message {mid}: empty text, skipping")
+                        log.debug(f"Message {mid}: not a signal")
                         continue
 
                     # Log first 200 chars of message for debugging
                     log.debug(f"Message {mid}: {txt[:200]}...")
 
-                    sig = parse_signal(txt, quote=QUOTE)
                     if not sig:
                         # Check if it looks like a signal but failed to parse
                         if "SIGNAL" in txt.upper() or "ENTRY" in txt.upper():
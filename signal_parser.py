@@ -2,7 +2,22 @@ import re
 import hashlib
 from typing import Any, Dict, Optional, List
 
-NUM = r"([0-9]+(?:\.[0-9]+)?)"
+try:
+    import re2
+except ImportError:  # google-re2 is optional, fall back to the stdlib engine
+    re2 = None
+
+# Signal patterns are matched against the casefolded text as UTF-8 bytes
+# (so they are lowercase and need no IGNORECASE), using re2 (linear-time,
+# no backtracking on untrusted Discord text) when it is installed.
+_re = re if re2 is None else re2
+
+# \s in byte patterns, re2 and the price scanner only covers ASCII whitespace,
+# so other Unicode spaces (e.g. the U+00A0 html.unescape makes of &nbsp;) are
+# mapped to " " before encoding; \s on str used to accept all of them.
+_RE_UNICODE_SPACE = re.compile("[%s]" % "".join(
+    chr(c) for c in range(0x3001) if chr(c).isspace() and chr(c) not in " \t\n\r\f\v"
+))
 
 # ============================================================
 # AO Trading Signal Parser (Embed format)
@@ -20,23 +35,144 @@ NUM = r"([0-9]+(?:\.[0-9]+)?)"
 
 # Signal type detection
 # Accept: "NEW SIGNAL", "NEW TRADE SIGNAL", "LONG SIGNAL", "SHORT SIGNAL", or "Trade Signal"
-RE_NEW_SIGNAL = re.compile(r"NEW SIGNAL|NEW TRADE SIGNAL|(?:LONG|SHORT)\s+SIGNAL|Trade\s+Signal", re.I)
-RE_CANCELLED = re.compile(r"TRADE CANCELLED|TRADE CLOSED", re.I)
+RE_NEW_SIGNAL = _re.compile(rb"new signal|new trade signal|(?:long|short)\s+signal|trade\s+signal")
+RE_CANCELLED = _re.compile(rb"trade cancelled|trade closed")
 
 # Side and symbol: "SHORT SIGNAL - OL/USDT" or "LONG SIGNAL - BTC/USDT"
-RE_SIDE_SYMBOL = re.compile(r"(LONG|SHORT)\s+SIGNAL\s*[-–—]\s*([A-Z0-9]+)\s*/\s*([A-Z0-9]+)", re.I)
+# (dashes as an alternation: a byte class would split the multibyte en/em dash;
+# \s is ASCII-only here, parse_signal maps Unicode spaces to " " first)
+RE_SIDE_SYMBOL = _re.compile(r"(long|short)\s+signal\s*(?:-|–|—)\s*([a-z0-9]+)\s*/\s*([a-z0-9]+)".encode("utf-8"))
+
+# Closed status: "⏳ Closed" (stdlib re on str, keeps the emoji a single character)
+RE_CLOSED = re.compile(r"⏳\s*closed")
+
+# Gate patterns scanned in a single pass with re2.Set (when available):
+# a message is a signal candidate only if all REQUIRED and none of REJECT hit.
+_GATE_PATTERNS = (RE_NEW_SIGNAL, RE_SIDE_SYMBOL, RE_CANCELLED, RE_CLOSED)
+_GATE_REQUIRED = frozenset((0, 1))
+_GATE_REJECT = frozenset((2, 3))
+
+
+def _build_gate_set():
+    if re2 is None:
+        return None
+    gate = re2.Set.SearchSet()
+    for pat in _GATE_PATTERNS:
+        gate.Add(pat.pattern)
+    gate.Compile()
+    return gate
+
+
+_GATE_SET = _build_gate_set()
+
+# ------------------------------------------------------------
+# Price levels: plain bytes.find scan over the casefolded UTF-8 text
+# ------------------------------------------------------------
+# Each label is followed by [:\s]* and an optional "$", then the price:
+#   Entry:      "Entry: 0.01740" or "Entry $0.01740" or "Entry: $0.01740"
+#   TP levels:  "TP1: 0.01719" or "TP1: $0.01719"
+#   DCA level:  "DCA1: 0.01800" or "DCA #1: $0.01800" (only DCA1 supported)
+#   Stop Loss:  "Stop Loss: 0.01846" or "StopLoss: $0.01846"
+# Indexing bytes yields ints, hence the int-membership tests below.
+_DIGITS = b"0123456789"
+_SPACE = b" \t\n\r\f\v"
+_LABEL_SEP = b":" + _SPACE
+
+
+def _num_at(s: bytes, i: int) -> Optional[float]:
+    """Parse `[:\\s]*\\$?[0-9]+(\\.[0-9]+)?` at s[i], or None if there is no price."""
+    n = len(s)
+    while i < n and s[i] in _LABEL_SEP:
+        i += 1
+    if i < n and s[i] == 0x24:  # "$"
+        i += 1
+    j = i
+    while j < n and s[j] in _DIGITS:
+        j += 1
+    if j == i:
+        return None
+    if j + 1 < n and s[j] == 0x2E and s[j + 1] in _DIGITS:  # "."
+        j += 2
+        while j < n and s[j] in _DIGITS:
+            j += 1
+    return float(s[i:j])
+
+
+def _skip_space(s: bytes, i: int) -> int:
+    n = len(s)
+    while i < n and s[i] in _SPACE:
+        i += 1
+    return i
 
-# Entry price: "Entry: 0.01740" or "Entry $0.01740" or "Entry: $0.01740"
-RE_ENTRY = re.compile(r"Entry[:\s]*\$?" + NUM, re.I)
 
-# Take Profit levels: "TP1: 0.01719" or "TP1: $0.01719"
-RE_TP = re.compile(r"TP(\d+)[:\s]*\$?" + NUM, re.I)
+def _scan_numbers(s: bytes):
+    """Scan casefolded UTF-8 signal text for its price levels.
 
-# DCA level: "DCA1: 0.01800" or "DCA1: $0.01800" (only DCA1 supported)
-RE_DCA = re.compile(r"DCA\s*#?\s*1?[:\s]*\$?" + NUM, re.I)
+    Returns (entry, tps, dca, sl); entry/dca/sl are the first price found
+    for that label (or None), tps are ordered by TP index.
+    """
+    n = len(s)
+
+    entry = None
+    i = s.find(b"entry")
+    while i != -1:
+        entry = _num_at(s, i + 5)
+        if entry is not None:
+            break
+        i = s.find(b"entry", i + 1)
+
+    tps_by_idx: Dict[int, float] = {}
+    i = s.find(b"tp")
+    while i != -1:
+        j = i + 2
+        while j < n and s[j] in _DIGITS:
+            j += 1
+        if j > i + 2:
+            price = _num_at(s, j)
+            if price is None and j > i + 3:
+                # "TP12" with no price after it reads as TP1 = 2 (same as the old regex)
+                j -= 1
+                price = _num_at(s, j)
+            if price is not None:
+                tps_by_idx[int(s[i + 2:j])] = price
+        i = s.find(b"tp", i + 1)
+    tps = [tps_by_idx[k] for k in sorted(tps_by_idx) if tps_by_idx[k] > 0]
+
+    dca = None
+    i = s.find(b"dca")
+    while i != -1:
+        j = _skip_space(s, i + 3)
+        if j < n and s[j] == 0x23:  # "#"
+            j = _skip_space(s, j + 1)
+        if j < n and s[j] == 0x31:  # "1"
+            # "DCA1: x" - or "DCA 1.5" where the 1 belongs to the price
+            dca = _num_at(s, j + 1)
+        if dca is None:
+            dca = _num_at(s, j)
+        if dca is not None:
+            break
+        i = s.find(b"dca", i + 1)
+
+    sl = None
+    i = s.find(b"stop")
+    while i != -1:
+        j = _skip_space(s, i + 4)
+        if s.startswith(b"loss", j):
+            sl = _num_at(s, j + 4)
+            if sl is not None:
+                break
+        i = s.find(b"stop", i + 1)
+
+    return entry, tps, dca, sl
+
+
+# Pure-Python reference, kept for the compiled-scanner parity check
+_scan_numbers_py = _scan_numbers
 
-# Stop Loss: "Stop Loss: 0.01846" or "Stop Loss: $0.01846"
-RE_SL = re.compile(r"Stop\s*Loss[:\s]*\$?" + NUM, re.I)
+try:  # optional compiled scanner, see signal_parser_fast.pyx
+    from signal_parser_fast import scan_numbers as _scan_numbers
+except ImportError:
+    pass
 
 
 def parse_signal(text: str, quote: str = "USDT") -> Optional[Dict[str, Any]]:
@@ -49,26 +185,45 @@ def parse_signal(text: str, quote: str = "USDT") -> Optional[Dict[str, Any]]:
     Returns:
         Parsed signal dict or None if not a valid signal
     """
-    # Must be a NEW SIGNAL
-    if not RE_NEW_SIGNAL.search(text):
+    # Cheap prescan: every accepted header contains "signal", so most
+    # channel chatter is rejected before touching the regex engine
+    tl = text.casefold()
+    if "signal" not in tl:
         return None
-
-    # Skip cancelled/closed trades
-    if RE_CANCELLED.search(text):
+    # Entry and TP levels are mandatory, check the labels before any regex runs
+    if "entry" not in tl or "tp" not in tl:
         return None
 
-    # Also skip if "closed" appears as status (with hourglass emoji)
-    if re.search(r"⏳\s*closed", text, re.I):
-        return None
+    # Encode once; the byte patterns and the price scanner run on tl_b
+    tl = _RE_UNICODE_SPACE.sub(" ", tl)
+    tl_b = tl.encode("utf-8")
+
+    if _GATE_SET is not None:
+        # One DFA pass over the text instead of a search per pattern
+        hits = frozenset(_GATE_SET.Match(tl_b) or ())
+        if not _GATE_REQUIRED <= hits or hits & _GATE_REJECT:
+            return None
+    else:
+        # Must be a NEW SIGNAL
+        if not RE_NEW_SIGNAL.search(tl_b):
+            return None
+
+        # Skip cancelled/closed trades
+        if RE_CANCELLED.search(tl_b):
+            return None
+
+        # Also skip if "closed" appears as status (with hourglass emoji)
+        if "closed" in tl and RE_CLOSED.search(tl):
+            return None
 
     # Parse side and symbol
-    m_side = RE_SIDE_SYMBOL.search(text)
+    m_side = RE_SIDE_SYMBOL.search(tl_b)
     if not m_side:
         return None
 
-    side_word = m_side.group(1).upper()
-    base = m_side.group(2).upper()
-    quote_found = m_side.group(3).upper()
+    side_word = m_side.group(1).decode("ascii").upper()
+    base = m_side.group(2).decode("ascii").upper()
+    quote_found = m_side.group(3).decode("ascii").upper()
 
     # Verify quote currency matches
     if quote_found != quote.upper():
@@ -77,40 +232,18 @@ def parse_signal(text: str, quote: str = "USDT") -> Optional[Dict[str, Any]]:
     side = "sell" if side_word == "SHORT" else "buy"
     symbol = f"{base}{quote}"
 
-    # Parse entry price
-    m_entry = RE_ENTRY.search(text)
-    if not m_entry:
+    # Parse entry, Take Profit levels (TP1, TP2, ...), first DCA and first Stop Loss
+    trigger, tps, dca_price, sl_price = _scan_numbers(tl_b)
+    if trigger is None:
         return None
-    trigger = float(m_entry.group(1).replace(",", ""))
-
-    # Parse Take Profit levels (TP1, TP2, TP3, TP4, ...)
-    tps: List[float] = []
-    for m in RE_TP.finditer(text):
-        idx = int(m.group(1))
-        price = float(m.group(2).replace(",", ""))
-        # Ensure list is long enough
-        while len(tps) < idx:
-            tps.append(0.0)
-        tps[idx - 1] = price
-    # Remove any zero placeholders
-    tps = [p for p in tps if p > 0]
 
     if not tps:
         return None  # No TPs = invalid signal
 
     # Parse DCA (only 0-1 DCA for AO Trading)
     dcas: List[float] = []
-    m_dca = RE_DCA.search(text)
-    if m_dca:
-        dca_price = float(m_dca.group(1).replace(",", ""))
-        if dca_price > 0:
-            dcas.append(dca_price)
-
-    # Parse Stop Loss
-    sl_price = None
-    m_sl = RE_SL.search(text)
-    if m_sl:
-        sl_price = float(m_sl.group(1).replace(",", ""))
+    if dca_price is not None and dca_price > 0:
+        dcas.append(dca_price)
 
     return {
         "base": base,
@@ -125,6 +258,11 @@ def parse_signal(text: str, quote: str = "USDT") -> Optional[Dict[str, Any]]:
 
 
 def signal_hash(sig: Dict[str, Any]) -> str:
-    """Generate unique hash for signal deduplication."""
+    """Generate unique hash for signal deduplication.
+
+    Stored in state.json across restarts, so it must be a stable string
+    (builtin hash() is salted per process). Not security relevant, so a
+    short blake2b digest is enough.
+    """
     core = f"{sig.get('symbol')}|{sig.get('side')}|{sig.get('trigger')}|{sig.get('tp_prices')}|{sig.get('dca_prices')}"
-    return hashlib.md5(core.encode("utf-8")).hexdigest()
+    return hashlib.blake2b(core.encode("utf-8"), digest_size=8).hexdigest()
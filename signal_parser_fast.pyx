@@ -0,0 +1,119 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""Compiled build of signal_parser._scan_numbers (optional).
+
+Build in place with:  cythonize -3 -i signal_parser_fast.pyx
+signal_parser falls back to the pure-Python scanner when this module is
+not built. Keep both implementations in sync; test_parser.py compares
+them whenever this module is built.
+"""
+
+from libc.string cimport memchr, memcmp
+
+
+cdef inline bint _is_digit(unsigned char c):
+    return 0x30 <= c <= 0x39  # "0".."9"
+
+
+cdef inline bint _is_space(unsigned char c):
+    return c == 0x20 or 0x09 <= c <= 0x0D  # " \t\n\v\f\r"
+
+
+cdef Py_ssize_t _find(const unsigned char *s, Py_ssize_t n, const char *sub, Py_ssize_t m, Py_ssize_t start):
+    """memchr for the first label byte, then memcmp the rest; -1 if absent."""
+    cdef const unsigned char *p
+    while start + m <= n:
+        p = <const unsigned char *>memchr(s + start, sub[0], n - m - start + 1)
+        if p == NULL:
+            return -1
+        start = p - s
+        if memcmp(p, sub, m) == 0:
+            return start
+        start += 1
+    return -1
+
+
+cdef Py_ssize_t _skip_space(const unsigned char *s, Py_ssize_t i, Py_ssize_t n):
+    while i < n and _is_space(s[i]):
+        i += 1
+    return i
+
+
+cdef bint _num_at(bytes b, const unsigned char *s, Py_ssize_t i, Py_ssize_t n, double *out):
+    """Parse [:\\s]*\\$?[0-9]+(\\.[0-9]+)? at s[i] into out; False if no price."""
+    cdef Py_ssize_t j
+    while i < n and (s[i] == 0x3A or _is_space(s[i])):  # ":"
+        i += 1
+    if i < n and s[i] == 0x24:  # "$"
+        i += 1
+    j = i
+    while j < n and _is_digit(s[j]):
+        j += 1
+    if j == i:
+        return False
+    if j + 1 < n and s[j] == 0x2E and _is_digit(s[j + 1]):  # "."
+        j += 2
+        while j < n and _is_digit(s[j]):
+            j += 1
+    out[0] = float(b[i:j])
+    return True
+
+
+def scan_numbers(bytes b):
+    """Scan casefolded UTF-8 signal text for its price levels.
+
+    Returns (entry, tps, dca, sl); entry/dca/sl are the first price found
+    for that label (or None), tps are ordered by TP index.
+    """
+    cdef const unsigned char *s = b
+    cdef Py_ssize_t n = len(b)
+    cdef Py_ssize_t i, j
+    cdef double price
+    cdef bint found
+    cdef dict tps_by_idx = {}
+
+    entry = None
+    i = _find(s, n, b"entry", 5, 0)
+    while i != -1:
+        if _num_at(b, s, i + 5, n, &price):
+            entry = price
+            break
+        i = _find(s, n, b"entry", 5, i + 1)
+
+    i = _find(s, n, b"tp", 2, 0)
+    while i != -1:
+        j = i + 2
+        while j < n and _is_digit(s[j]):
+            j += 1
+        if j > i + 2:
+            found = _num_at(b, s, j, n, &price)
+            if not found and j > i + 3:
+                # "TP12" with no price after it reads as TP1 = 2 (same as the old regex)
+                j -= 1
+                found = _num_at(b, s, j, n, &price)
+            if found:
+                tps_by_idx[int(b[i + 2:j])] = price
+        i = _find(s, n, b"tp", 2, i + 1)
+    tps = [tps_by_idx[k] for k in sorted(tps_by_idx) if tps_by_idx[k] > 0]
+
+    dca = None
+    i = _find(s, n, b"dca", 3, 0)
+    while i != -1:
+        j = _skip_space(s, i + 3, n)
+        if j < n and s[j] == 0x23:  # "#"
+            j = _skip_space(s, j + 1, n)
+        # "DCA1: x" - or "DCA 1.5" where the 1 belongs to the price
+        if (j < n and s[j] == 0x31 and _num_at(b, s, j + 1, n, &price)) or _num_at(b, s, j, n, &price):
+            dca = price
+            break
+        i = _find(s, n, b"dca", 3, i + 1)
+
+    sl = None
+    i = _find(s, n, b"stop", 4, 0)
+    while i != -1:
+        j = _skip_space(s, i + 4, n)
+        if j + 4 <= n and memcmp(s + j, b"loss", 4) == 0 and _num_at(b, s, j + 4, n, &price):
+            sl = price
+            break
+        i = _find(s, n, b"stop", 4, i + 1)
+
+    return entry, tps, dca, sl
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Offline checks for signal_parser - no Discord, Bybit or .env needed.
+Run with: python test_parser.py   (or pytest)
+"""
+
+import random
+import unittest
+
+from signal_parser import parse_signal, _scan_numbers_py
+
+try:
+    import signal_parser_fast
+except ImportError:  # optional Cython build, see README
+    signal_parser_fast = None
+
+# ============================================================
+# AO Trading Signal Format (Embed-style)
+# ============================================================
+# Test with DCA:
+TEST_SIGNAL_WITH_DCA = """
+📊 NEW SIGNAL • OL • Entry $0.01740
+
+AO Trading • New Trade Signal
+🔴 SHORT SIGNAL - OL/USDT
+Leverage: 25x • Trader: haseeb1111
+
+📊 Entry: 0.01740 ⏳ Pending
+
+🎯 Profit Targets:
+🎯 TP1: 0.01719 → NEXT
+⏳ TP2: 0.01698 Pending
+⏳ TP3: 0.01670 Pending
+⏳ TP4: 0.01601 Pending
+
+📊 DCA Levels:
+⏳ DCA1: 0.01800 Pending
+
+🛡️ Stop Loss: 0.01846
+
+📊 TRADE NOW:
+ByBit • MEXC • Blofin • Bitget
+
+AO Trading • Trade Together. Win Together. 🚀
+"""
+
+# Test without DCA:
+TEST_SIGNAL_NO_DCA = """
+📊 NEW SIGNAL • BTC • Entry $42500.00
+
+AO Trading • New Trade Signal
+🟢 LONG SIGNAL - BTC/USDT
+Leverage: 10x • Trader: haseeb1111
+
+📊 Entry: 42500.00 ⏳ Pending
+
+🎯 Profit Targets:
+🎯 TP1: 42800.00 → NEXT
+⏳ TP2: 43100.00 Pending
+⏳ TP3: 43500.00 Pending
+
+🛡️ Stop Loss: 41800.00
+
+AO Trading • Trade Together. Win Together. 🚀
+"""
+
+
+EXPECTED_WITH_DCA = {
+    "base": "OL",
+    "symbol": "OLUSDT",
+    "side": "sell",
+    "trigger": 0.0174,
+    "tp_prices": [0.01719, 0.01698, 0.0167, 0.01601],
+    "dca_prices": [0.018],
+    "sl_price": 0.01846,
+    "raw": TEST_SIGNAL_WITH_DCA[:500],
+}
+
+EXPECTED_NO_DCA = {
+    "base": "BTC",
+    "symbol": "BTCUSDT",
+    "side": "buy",
+    "trigger": 42500.0,
+    "tp_prices": [42800.0, 43100.0, 43500.0],
+    "dca_prices": [],
+    "sl_price": 41800.0,
+    "raw": TEST_SIGNAL_NO_DCA[:500],
+}
+
+
+def _expect(text, base, **changes):
+    """Expected parse of an edited sample: base result with changes applied."""
+    return {**base, **changes, "raw": text[:500]}
+
+
+def test_samples():
+    assert parse_signal(TEST_SIGNAL_WITH_DCA) == EXPECTED_WITH_DCA
+    assert parse_signal(TEST_SIGNAL_NO_DCA) == EXPECTED_NO_DCA
+
+
+def test_dca_without_index():
+    # "DCA 1.5": the 1 belongs to the price, not the DCA label
+    text = TEST_SIGNAL_WITH_DCA.replace("DCA1: 0.01800", "DCA 1.5")
+    assert parse_signal(text) == _expect(text, EXPECTED_WITH_DCA, dca_prices=[1.5])
+
+
+def test_tp_without_price():
+    # "TP12" with no price reads as TP1 = 2 (kept from the old regex)
+    text = TEST_SIGNAL_NO_DCA.replace("TP3: 43500.00", "TP12")
+    assert parse_signal(text) == _expect(text, EXPECTED_NO_DCA, tp_prices=[2.0, 43100.0])
+
+
+def test_tp0_sorts_first():
+    text = TEST_SIGNAL_NO_DCA.replace("TP3: 43500.00", "TP0: 42600.00")
+    assert parse_signal(text) == _expect(text, EXPECTED_NO_DCA, tp_prices=[42600.0, 42800.0, 43100.0])
+
+
+def test_nbsp_separators():
+    # html.unescape turns &nbsp; into U+00A0
+    text = (TEST_SIGNAL_WITH_DCA
+            .replace("Entry: ", "Entry:\xa0")
+            .replace("TP1: ", "TP1:\xa0")
+            .replace("DCA1: ", "DCA1:\xa0")
+            .replace("Stop Loss: ", "Stop\xa0Loss:\xa0"))
+    assert parse_signal(text) == _expect(text, EXPECTED_WITH_DCA)
+
+
+def test_nbsp_side_symbol():
+    text = TEST_SIGNAL_WITH_DCA.replace("SHORT SIGNAL - OL/USDT", "SHORT SIGNAL\xa0-\xa0OL/USDT")
+    assert parse_signal(text) == _expect(text, EXPECTED_WITH_DCA)
+
+
+def test_not_signals():
+    assert parse_signal("hello world") is None
+    assert parse_signal(TEST_SIGNAL_WITH_DCA.replace("USDT", "USDC")) is None
+    assert parse_signal(TEST_SIGNAL_WITH_DCA + "\n⏳ Closed") is None
+    assert parse_signal(TEST_SIGNAL_WITH_DCA + "\nTRADE CANCELLED") is None
+
+
+def _scanner_inputs():
+    """Byte inputs for the compiled/Python scanner parity check."""
+    texts = [TEST_SIGNAL_WITH_DCA, TEST_SIGNAL_NO_DCA, "", "tp", "entry", "dca 1.5", "tp12", "tp0: 5"]
+    toks = ["entry", "tp", "tp1", "tp12", "tp0", "dca", "dca1", "dca #", "stop loss", "stoploss", "stop",
+            "los", ":", " ", "\t", "\r", "\v", "$", "0.5", "12", "3.", ".7", "1", "#", "x", "⏳", "9.99"]
+    rng = random.Random(0)
+    texts += ["".join(rng.choice(toks) for _ in range(rng.randint(1, 20))) for _ in range(5000)]
+    return [t.casefold().encode("utf-8") for t in texts]
+
+
+def test_compiled_scanner_parity():
+    if signal_parser_fast is None:
+        raise unittest.SkipTest("signal_parser_fast not built")
+    for data in _scanner_inputs():
+        assert signal_parser_fast.scan_numbers(data) == _scan_numbers_py(data), data
+
+
+if __name__ == "__main__":
+    tests = [(name, fn) for name, fn in sorted(globals().items()) if name.startswith("test_")]
+    for name, fn in tests:
+        try:
+            fn()
+        except unittest.SkipTest as e:
+            print(f"⏭️  {name}: skipped ({e})")
+            continue
+        print(f"✅ {name}")
+    print(f"{len(tests)} checks run")
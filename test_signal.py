@@ -27,55 +27,8 @@ fmt = logging.Formatter("%(asctime)s | %(levelname)s | %(message)s", "%H:%M:%S")
 h.setFormatter(fmt)
 log.handlers[:] = [h]
 
-# ============================================================
-# AO Trading Signal Format (Embed-style)
-# ============================================================
-# Test with DCA:
-TEST_SIGNAL_WITH_DCA = """
-📊 NEW SIGNAL • OL • Entry $0.01740
-
-AO Trading • New Trade Signal
-🔴 SHORT SIGNAL - OL/USDT
-Leverage: 25x • Trader: haseeb1111
-
-📊 Entry: 0.01740 ⏳ Pending
-
-🎯 Profit Targets:
-🎯 TP1: 0.01719 → NEXT
-⏳ TP2: 0.01698 Pending
-⏳ TP3: 0.01670 Pending
-⏳ TP4: 0.01601 Pending
-
-📊 DCA Levels:
-⏳ DCA1: 0.01800 Pending
-
-🛡️ Stop Loss: 0.01846
-
-📊 TRADE NOW:
-ByBit • MEXC • Blofin • Bitget
-
-AO Trading • Trade Together. Win Together. 🚀
-"""
-
-# Test without DCA:
-TEST_SIGNAL_NO_DCA = """
-📊 NEW SIGNAL • BTC • Entry $42500.00
-
-AO Trading • New Trade Signal
-🟢 LONG SIGNAL - BTC/USDT
-Leverage: 10x • Trader: haseeb1111
-
-📊 Entry: 42500.00 ⏳ Pending
-
-🎯 Profit Targets:
-🎯 TP1: 42800.00 → NEXT
-⏳ TP2: 43100.00 Pending
-⏳ TP3: 43500.00 Pending
-
-🛡️ Stop Loss: 41800.00
-
-AO Trading • Trade Together. Win Together. 🚀
-"""
+# AO Trading sample signals (shared with the offline parser checks)
+from test_parser import TEST_SIGNAL_WITH_DCA, TEST_SIGNAL_NO_DCA
 
 # Default test signal (with DCA)
 TEST_SIGNAL = TEST_SIGNAL_WITH_DCA